@@ -0,0 +1,36 @@
+"""Shared image discovery and byte caching for the demo scripts."""
+
+import glob
+import os
+
+IMAGE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "on_the_phone")
+PEOPLE_DIR = os.path.join(IMAGE_DIR, "more_people")
+
+# Directory listings keyed by directory mtime, so the scripts glob each
+# folder at most once until its contents change.
+_listing_cache = {}
+
+# File bytes keyed by path and validated by mtime, so repeated uploads of
+# the same image never re-read the file from disk.
+_file_cache = {}
+
+
+def list_pngs(directory):
+    """Return the sorted PNG paths in a directory, cached per directory mtime."""
+    mtime = os.stat(directory).st_mtime_ns
+    cached = _listing_cache.get(directory)
+    if cached is None or cached[0] != mtime:
+        cached = (mtime, sorted(glob.glob(os.path.join(directory, "*.png"))))
+        _listing_cache[directory] = cached
+    return cached[1]
+
+
+def read_image_bytes(path):
+    """Read a PNG once per on-disk version."""
+    mtime = os.stat(path).st_mtime_ns
+    cached = _file_cache.get(path)
+    if cached is None or cached[0] != mtime:
+        with open(path, "rb") as f:
+            cached = (mtime, f.read())
+        _file_cache[path] = cached
+    return cached[1]
@@ -1,35 +1,61 @@
 import asyncio
-import glob
+import functools
+import json
 import os
 import random
-import signal
-import threading
-import time
-from io import BytesIO
+from collections import deque
 
+import aiofiles
+import aiohttp
+import cv2
 import fal_client
 import numpy as np
-from flask import Flask, Response, render_template_string, jsonify
+import uvicorn
+from fastapi import FastAPI
+from fastapi.responses import HTMLResponse, StreamingResponse
 from PIL import Image
 from odyssey import Odyssey, OdysseyAuthError, OdysseyConnectionError
 
-app = Flask(__name__)
+from image_library import IMAGE_DIR, PEOPLE_DIR, list_pngs, read_image_bytes
 
-# Global variables for frame sharing
+app = FastAPI()
+
+# Global variables for frame sharing. Everything runs on the server's
+# event loop, so a single-slot asyncio queue (latest value wins) replaces
+# the old lock-guarded globals. A single encoder task drains the queue and
+# publishes the encoded JPEG for every connected viewer.
 current_frame = None
-frame_lock = threading.Lock()
+frame_queue = asyncio.Queue(maxsize=1)
+latest_jpeg = None
+jpeg_version = 0
+jpeg_event = asyncio.Event()
+encoder_task = None
 stream_active = False
 should_shutdown = False
 session_started = False
 current_prompt = ""
 current_pair_label = ""
 fal_status = ""
+odyssey_task = None
+
+# Status push: bump a version and wake SSE subscribers whenever any of the
+# displayed status globals change.
+status_version = 0
+status_event = asyncio.Event()
+
+
+def set_status(**updates):
+    """Update status globals and wake SSE subscribers."""
+    global status_version
+    globals().update(updates)
+    status_version += 1
+    status_event.set()
+    status_event.clear()
+
 
 # Configuration
 API_KEY = os.environ["API_KEY"]
 
-IMAGE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "on_the_phone")
-PEOPLE_DIR = os.path.join(IMAGE_DIR, "more_people")
 INITIAL_IMAGE = os.path.join(IMAGE_DIR, "01_02.png")
 
 TOTAL_DURATION = 200
@@ -43,6 +69,21 @@ INTERACTION_PROMPTS = [
 
 SECONDS_PER_SEGMENT = SECONDS_PER_STEP * len(INTERACTION_PROMPTS)
 
+# JPEG encode settings for the MJPEG stream (libjpeg-turbo via OpenCV).
+# Quality 72 with forced 4:2:0 chroma subsampling roughly halves the bytes
+# per frame versus quality 85 with no visible loss on generated video;
+# smaller frames also mean cheaper encodes and a friendlier uplink.
+JPEG_PARAMS = (
+    cv2.IMWRITE_JPEG_QUALITY,
+    72,
+    cv2.IMWRITE_JPEG_SAMPLING_FACTOR,
+    cv2.IMWRITE_JPEG_SAMPLING_FACTOR_420,
+)
+
+# Static multipart framing, concatenated once per frame via b"".join
+MJPEG_PREFIX = b"--frame\r\nContent-Type: image/jpeg\r\n\r\n"
+MJPEG_SUFFIX = b"\r\n"
+
 FAL_COMBINE_PROMPT = (
     "combine these two people calling on the phone into one image, "
     "there's a vertical line between them like a photo composition. "
@@ -54,31 +95,49 @@ FAL_COMBINE_PROMPT = (
 def load_people():
     """Load all individual person images from more_people/."""
     people = {}
-    for path in sorted(glob.glob(os.path.join(PEOPLE_DIR, "*.png"))):
+    for path in list_pngs(PEOPLE_DIR):
         name = os.path.splitext(os.path.basename(path))[0]  # "01", "02", etc.
         people[name] = path
     print(f"Loaded {len(people)} people: {', '.join(people.keys())}")
     return people
 
 
-async def generate_next_image(people, current_pair, pool):
+# Cached FAL upload tasks, one per on-disk portrait version — uploading
+# each portrait once is enough for the whole run.
+upload_tasks = {}
+
+
+def upload_person(people, name):
+    """Schedule (or reuse) the FAL upload for a person's portrait."""
+    path = people[name]
+    key = (name, os.stat(path).st_mtime_ns)
+    task = upload_tasks.get(key)
+    if task is None or (task.done() and task.exception() is not None):
+        task = asyncio.create_task(
+            fal_client.upload_async(read_image_bytes(path), content_type="image/png")
+        )
+        upload_tasks[key] = task
+    return task
+
+
+async def generate_next_image(people, current_pair, pool, session):
     """Generate combined image for a new pair using async fal API."""
-    global fal_status
 
     person_left, person_right = current_pair  # (left, right)
     keeper = random.choice([person_left, person_right])
 
     # Draw from pool without replacement, refill when exhausted
-    candidates = [p for p in pool if p != person_left and p != person_right]
-    if not candidates:
-        refill = [p for p in people if p != person_left and p != person_right]
+    exclude = {person_left, person_right}
+    if all(p in exclude for p in pool):
+        refill = [p for p in people if p not in exclude]
         random.shuffle(refill)
         pool.clear()
         pool.extend(refill)
-        candidates = list(pool)
 
-    newcomer = candidates[0]
-    pool.remove(newcomer)
+    # Rotate past the current pair instead of rebuilding a filtered list
+    while pool[0] in exclude:
+        pool.rotate(-1)
+    newcomer = pool.popleft()
 
     # Keeper switches sides: left→right or right→left
     if keeper == person_left:
@@ -88,12 +147,15 @@ async def generate_next_image(people, current_pair, pool):
 
     print(f"[FAL] Keeper: {keeper}, Newcomer: {newcomer} → {new_pair[0]} (L) + {new_pair[1]} (R)")
 
-    # Upload both images concurrently
-    fal_status = f"Uploading {keeper} + {newcomer}..."
+    # Upload both images concurrently (no-ops for people already uploaded),
+    # and prefetch the likely next newcomer so its URL is ready next segment
+    set_status(fal_status=f"Uploading {keeper} + {newcomer}...")
     print("[FAL] Uploading images...")
+    if pool:
+        upload_person(people, pool[0])
     url_keeper, url_newcomer = await asyncio.gather(
-        fal_client.upload_file_async(people[keeper]),
-        fal_client.upload_file_async(people[newcomer]),
+        upload_person(people, keeper),
+        upload_person(people, newcomer),
     )
     print(f"[FAL] Uploaded: {url_keeper[:60]}... , {url_newcomer[:60]}...")
 
@@ -104,7 +166,9 @@ async def generate_next_image(people, current_pair, pool):
         image_urls = [url_keeper, url_newcomer]
 
     # Submit generation and stream events
-    fal_status = f"Generating combined image ({new_pair[0]} (L) + {new_pair[1]} (R))..."
+    set_status(
+        fal_status=f"Generating combined image ({new_pair[0]} (L) + {new_pair[1]} (R))..."
+    )
     print("[FAL] Generating combined image...")
     handler = await fal_client.submit_async(
         "fal-ai/flux-2/flash/edit",
@@ -124,7 +188,7 @@ async def generate_next_image(people, current_pair, pool):
             for log in event.logs or []:
                 print(f"[FAL] {log['message']}")
         elif isinstance(event, fal_client.Queued):
-            fal_status = f"Queued ({new_pair[0]} + {new_pair[1]})..."
+            set_status(fal_status=f"Queued ({new_pair[0]} + {new_pair[1]})...")
 
     result = await handler.get()
 
@@ -132,18 +196,16 @@ async def generate_next_image(people, current_pair, pool):
     image_url = result["images"][0]["url"]
     print(f"[FAL] Got result: {image_url[:80]}...")
 
-    fal_status = "Downloading result image..."
-    import aiohttp
-    async with aiohttp.ClientSession() as session:
-        async with session.get(image_url) as resp:
-            image_bytes = await resp.read()
-
-    # Save to temp file for Odyssey
+    set_status(fal_status="Downloading result image...")
+    # Stream straight to disk for Odyssey instead of buffering the whole
+    # image in memory first
     temp_path = os.path.join(IMAGE_DIR, f"generated_{new_pair[0]}_{new_pair[1]}.png")
-    with open(temp_path, "wb") as f:
-        f.write(image_bytes)
+    async with session.get(image_url) as resp:
+        async with aiofiles.open(temp_path, "wb") as f:
+            async for chunk in resp.content.iter_chunked(65536):
+                await f.write(chunk)
 
-    fal_status = "Image ready!"
+    set_status(fal_status="Image ready!")
     print(f"[FAL] Saved combined image: {temp_path}")
     # Direction: push away the departing person
     direction = "left" if keeper == person_right else "right"
@@ -157,85 +219,139 @@ class SyntheticFrame:
 
 def save_frame(frame):
     global current_frame
-    with frame_lock:
-        current_frame = frame
+    current_frame = frame
+    # Latest-value handoff: drop the stale frame if the consumer is behind
+    try:
+        frame_queue.get_nowait()
+    except asyncio.QueueEmpty:
+        pass
+    frame_queue.put_nowait(frame)
 
 
-async def play_transition(last_frame_data, new_image_path, direction="left", duration=1.0, fps=30):
-    """Play a push transition with blended overlap for the keeper person."""
-    global current_frame
+# Transition canvas reused across segments — frames keep the same size for
+# a whole run, so allocate the 1.5x-wide buffer once.
+_transition_canvas = None
+
 
-    old_img = Image.fromarray(last_frame_data)
-    new_img = Image.open(new_image_path).resize(old_img.size)
-    new_img = Image.blend(old_img, new_img, 0.95)
+def _get_canvas(width, height):
+    global _transition_canvas
+    half = width // 2
+    if _transition_canvas is None or _transition_canvas.shape != (height, width + half, 3):
+        _transition_canvas = np.empty((height, width + half, 3), dtype=np.uint8)
+    return _transition_canvas
 
-    width, height = old_img.size
+
+@functools.lru_cache(maxsize=4)
+def _load_resized_at(path, size, mtime_ns):
+    """Decode a generated PNG and resize it to the stream size, cached per segment."""
+    img = Image.open(path).convert("RGB").resize(size, Image.Resampling.BILINEAR)
+    return np.asarray(img)
+
+
+def _load_resized(path, size):
+    """Cache-aware wrapper: generated_{A}_{B}.png paths are reused across
+    segments, so the mtime keys the cache to the file's current contents."""
+    return _load_resized_at(path, size, os.stat(path).st_mtime_ns)
+
+
+async def play_transition(last_frame_data, new_image_path, direction="left", duration=1.0, fps=30):
+    """Play a push transition with blended overlap for the keeper person."""
+    old = np.asarray(last_frame_data, dtype=np.uint8)
+    height, width = old.shape[:2]
     half = width // 2
     num_frames = int(duration * fps)
     frame_delay = duration / num_frames
 
-    # Gradient mask for the overlap blend zone (0=image2, 255=image1)
-    gradient_array = np.tile(np.linspace(0, 255, half, dtype=np.uint8), (height, 1))
-    gradient = Image.fromarray(gradient_array, mode="L")
+    new_arr = await asyncio.to_thread(_load_resized, new_image_path, (width, height))
+    new = new_arr.astype(np.float32)
+    # Image.blend(old, new, 0.95)
+    new = (old.astype(np.float32) * 0.05 + new * 0.95).astype(np.uint8)
+
+    # Gradient weights for the overlap blend zone (0=right term, 1=left term)
+    gradient = np.linspace(0.0, 1.0, half, dtype=np.float32)[None, :, None]
 
     # Build 1.5x canvas: [departing_half | keeper_blend | newcomer_half]
-    canvas = Image.new("RGB", (width + half, height))
+    canvas = _get_canvas(width, height)
 
     if direction == "left":
         # Old: [A | B], New: [B | C] → Canvas: [A | B_blend | C]
-        canvas.paste(old_img.crop((0, 0, half, height)), (0, 0))
-        blended = Image.composite(
-            new_img.crop((0, 0, half, height)),
-            old_img.crop((half, 0, width, height)),
-            gradient,
-        )
-        canvas.paste(blended, (half, 0))
-        canvas.paste(new_img.crop((half, 0, width, height)), (width, 0))
+        canvas[:, :half] = old[:, :half]
+        canvas[:, half:width] = (
+            new[:, :half] * gradient + old[:, half:] * (1.0 - gradient)
+        ).astype(np.uint8)
+        canvas[:, width:] = new[:, half:]
     else:
         # Old: [B | A], New: [C | B] → Canvas: [C | B_blend | A]
-        canvas.paste(new_img.crop((0, 0, half, height)), (0, 0))
-        blended = Image.composite(
-            old_img.crop((0, 0, half, height)),
-            new_img.crop((half, 0, width, height)),
-            gradient,
-        )
-        canvas.paste(blended, (half, 0))
-        canvas.paste(old_img.crop((half, 0, width, height)), (width, 0))
+        canvas[:, :half] = new[:, :half]
+        canvas[:, half:width] = (
+            old[:, :half] * gradient + new[:, half:] * (1.0 - gradient)
+        ).astype(np.uint8)
+        canvas[:, width:] = old[:, half:]
+
+    # Precompute the eased offsets for the whole sweep
+    ts = np.arange(num_frames + 1, dtype=np.float32) / num_frames
+    ts = ts * ts * (3 - 2 * ts)  # ease-in-out
+    if direction == "left":
+        offsets = (ts * half).astype(np.int32)  # 0 → half
+    else:
+        offsets = ((1 - ts) * half).astype(np.int32)  # half → 0
+
+    # Double-buffered output: np.copyto performs the slab copy as a single
+    # C memcpy into a preallocated frame, and alternating buffers keep the
+    # frame the encoder may still be reading intact.
+    out_a = np.empty((height, width, 3), dtype=np.uint8)
+    out_b = np.empty_like(out_a)
 
-    for i in range(num_frames + 1):
-        t = i / num_frames
-        t = t * t * (3 - 2 * t)  # ease-in-out
+    for i, offset in enumerate(offsets):
+        out = out_a if i % 2 == 0 else out_b
+        np.copyto(out, canvas[:, offset : offset + width])
+        save_frame(SyntheticFrame(out))
 
-        if direction == "left":
-            offset = int(t * half)  # 0 → half
-        else:
-            offset = int((1 - t) * half)  # half → 0
+        await asyncio.sleep(frame_delay)
 
-        frame_img = canvas.crop((offset, 0, offset + width, height))
 
-        with frame_lock:
-            current_frame = SyntheticFrame(np.array(frame_img))
+def _encode_jpeg(data):
+    return cv2.imencode(".jpg", cv2.cvtColor(data, cv2.COLOR_RGB2BGR), JPEG_PARAMS)
 
-        await asyncio.sleep(frame_delay)
+
+async def encode_frames():
+    """Encode each produced frame exactly once, no matter how many viewers."""
+    global latest_jpeg, jpeg_version
+    while True:
+        frame = await frame_queue.get()
+        # JPEG work runs on the default thread pool so the loop stays free
+        # for frame callbacks and HTTP writes
+        ok, encoded = await asyncio.to_thread(_encode_jpeg, frame.data)
+        if ok:
+            latest_jpeg = encoded.tobytes()
+            jpeg_version += 1
+            jpeg_event.set()
+            jpeg_event.clear()
 
 
-def generate_frames():
+def ensure_encoder():
+    global encoder_task
+    if encoder_task is None or encoder_task.done():
+        encoder_task = asyncio.create_task(encode_frames())
+
+
+async def generate_frames():
+    last_version = -1
     while True:
-        with frame_lock:
-            if current_frame is not None:
-                img = Image.fromarray(current_frame.data)
-                buffer = BytesIO()
-                img.save(buffer, format="JPEG", quality=85)
-                frame_bytes = buffer.getvalue()
-                yield (
-                    b"--frame\r\n"
-                    b"Content-Type: image/jpeg\r\n\r\n" + frame_bytes + b"\r\n"
-                )
-        time.sleep(0.033)
+        # Wait for the encoder to publish a new JPEG; time out to re-send
+        # the last one as a keep-alive.
+        if latest_jpeg is None or jpeg_version == last_version:
+            try:
+                await asyncio.wait_for(jpeg_event.wait(), timeout=0.5)
+            except TimeoutError:
+                pass
+        if latest_jpeg is not None:
+            last_version = jpeg_version
+            yield b"".join((MJPEG_PREFIX, latest_jpeg, MJPEG_SUFFIX))
 
 
 async def run_odyssey():
-    global stream_active, should_shutdown, current_prompt, current_pair_label, fal_status
+    global should_shutdown
 
     people = load_people()
     client = Odyssey(api_key=API_KEY)
@@ -244,26 +360,35 @@ async def run_odyssey():
     current_pair = ("01", "02")
     elapsed = 0
 
+    # One HTTP session for all FAL result downloads — reuses DNS cache and
+    # TCP/TLS connections across segments.
+    session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=128, limit_per_host=64, ttl_dns_cache=300)
+    )
+
     try:
         await client.connect(
             on_video_frame=save_frame,
             on_stream_started=lambda sid: print(f"Stream ready: {sid}"),
         )
 
-        stream_active = True
+        set_status(stream_active=True)
         fal_task = None
-        pool = list(people.keys())
-        random.shuffle(pool)
+        pool = deque(random.sample(list(people), len(people)))
 
         while elapsed < TOTAL_DURATION and not should_shutdown:
-            current_pair_label = f"Person {current_pair[0]} + Person {current_pair[1]}"
+            set_status(
+                current_pair_label=f"Person {current_pair[0]} + Person {current_pair[1]}"
+            )
             print(f"\n=== Segment at {elapsed}s | {current_pair_label} ===")
 
             # Only start a new fal task if there isn't one already running
             if fal_task is None:
-                fal_task = asyncio.create_task(generate_next_image(people, current_pair, pool))
+                fal_task = asyncio.create_task(
+                    generate_next_image(people, current_pair, pool, session)
+                )
             else:
-                fal_status = "Still running from previous segment..."
+                set_status(fal_status="Still running from previous segment...")
                 print("[FAL] Previous generation still running, waiting...")
 
             # Run 30s segment: start_stream + 2 interactions at 10s intervals
@@ -272,7 +397,7 @@ async def run_odyssey():
                     print(f"[SHUTDOWN] Breaking out of interaction loop (should_shutdown={should_shutdown})")
                     break
 
-                current_prompt = prompt
+                set_status(current_prompt=prompt)
                 step_time = elapsed + i * SECONDS_PER_STEP
                 print(f"[{step_time}s] {'START' if i == 0 else 'INTERACT'}: {prompt[:70]}...")
 
@@ -292,22 +417,25 @@ async def run_odyssey():
                     next_image, next_pair, direction = fal_task.result()
 
                     # Play push transition using last stream frame
-                    with frame_lock:
-                        last_data = current_frame.data if current_frame else None
+                    last_data = current_frame.data if current_frame else None
                     if last_data is not None:
-                        fal_status = f"Transitioning to {next_pair[0]} + {next_pair[1]}..."
+                        set_status(
+                            fal_status=f"Transitioning to {next_pair[0]} + {next_pair[1]}..."
+                        )
                         await play_transition(last_data, next_image, direction)
 
                     current_image = next_image
                     current_pair = next_pair
-                    fal_status = f"Switched to Person {next_pair[0]} + Person {next_pair[1]}"
+                    set_status(
+                        fal_status=f"Switched to Person {next_pair[0]} + Person {next_pair[1]}"
+                    )
                     print(f"[FAL] Switching to new pair: {next_pair}")
                 except Exception as e:
-                    fal_status = "Generation failed, reusing current pair"
+                    set_status(fal_status="Generation failed, reusing current pair")
                     print(f"[FAL] Generation failed, reusing current image: {e}")
                 fal_task = None  # Allow new generation next segment
             else:
-                fal_status = "Still running, reusing current pair..."
+                set_status(fal_status="Still running, reusing current pair...")
                 print("[FAL] Image not ready yet, reusing current pair")
                 # Keep fal_task alive, don't cancel — it'll be checked next segment
 
@@ -323,23 +451,24 @@ async def run_odyssey():
         print("Stream cancelled")
     finally:
         print(f"[SHUTDOWN] Disconnecting client (stream_active={stream_active})")
+        await session.close()
         await client.disconnect()
-        stream_active = False
-        current_prompt = ""
+        set_status(stream_active=False, current_prompt="")
         print(f"[SHUTDOWN] Done (stream_active={stream_active})")
 
 
-def start_odyssey_thread():
+async def run_odyssey_task():
+    """Run the odyssey session as a background task on the server's loop."""
     try:
-        asyncio.run(run_odyssey())
+        await run_odyssey()
     except Exception as e:
         print(f"Odyssey error: {e}")
         import traceback
         traceback.print_exc()
 
 
-@app.route("/")
-def index():
+@app.get("/")
+async def index():
     html = """
     <!DOCTYPE html>
     <html>
@@ -458,10 +587,10 @@ def index():
                 btn.textContent = 'Stopping...';
                 await fetch('/stop_session', { method: 'POST' });
             }
-            setInterval(async () => {
+            const statusSource = new EventSource('/stream_status_sse');
+            statusSource.onmessage = (event) => {
                 try {
-                    const res = await fetch('/stream_status');
-                    const data = await res.json();
+                    const data = JSON.parse(event.data);
                     const el = document.getElementById('status');
                     const promptEl = document.getElementById('prompt');
                     const pairEl = document.getElementById('pair');
@@ -497,84 +626,92 @@ def index():
                         falEl.textContent = data.fal || '';
                     }
                 } catch (e) {}
-            }, 1000);
+            };
         </script>
     </body>
     </html>
     """
-    return render_template_string(html)
+    return HTMLResponse(html)
 
 
-@app.route("/start_session", methods=["POST"])
-def start_session():
-    global session_started
+@app.post("/start_session")
+async def start_session():
+    global odyssey_task
     if session_started:
-        return jsonify({"ok": False, "error": "Already started"})
-    session_started = True
-    odyssey_thread = threading.Thread(target=start_odyssey_thread, daemon=True)
-    odyssey_thread.start()
-    return jsonify({"ok": True})
+        return {"ok": False, "error": "Already started"}
+    set_status(session_started=True)
+    ensure_encoder()
+    odyssey_task = asyncio.create_task(run_odyssey_task())
+    return {"ok": True}
 
 
-@app.route("/stop_session", methods=["POST"])
-def stop_session():
-    global should_shutdown, session_started, current_frame
-    global current_prompt, current_pair_label, fal_status
+@app.post("/stop_session")
+async def stop_session():
+    global should_shutdown, current_frame, latest_jpeg
     print("[STOP] Stop requested, setting should_shutdown=True")
     should_shutdown = True
-    # Wait for the odyssey thread to actually finish
+    # Wait for the odyssey task to actually finish
     for i in range(30):  # up to 15 seconds
         if not stream_active:
             print(f"[STOP] Stream stopped after {i * 0.5}s")
             break
         print(f"[STOP] Waiting for stream to stop... ({i * 0.5}s, stream_active={stream_active})")
-        time.sleep(0.5)
+        await asyncio.sleep(0.5)
     # Reset state so a new session can start
     print("[STOP] Resetting state")
     should_shutdown = False
-    session_started = False
-    current_prompt = ""
-    current_pair_label = ""
-    fal_status = ""
-    with frame_lock:
-        current_frame = None
+    set_status(
+        session_started=False, current_prompt="", current_pair_label="", fal_status=""
+    )
+    current_frame = None
+    latest_jpeg = None
     print("[STOP] Ready for new session")
-    return jsonify({"ok": True})
+    return {"ok": True}
 
 
-@app.route("/stream_status")
-def stream_status():
-    return jsonify({
+def _status_snapshot():
+    return {
         "started": session_started,
         "active": stream_active,
         "prompt": current_prompt,
         "pair": current_pair_label,
         "fal": fal_status,
-    })
+    }
 
 
-@app.route("/video_feed")
-def video_feed():
-    return Response(
-        generate_frames(), mimetype="multipart/x-mixed-replace; boundary=frame"
-    )
+@app.get("/stream_status")
+async def stream_status():
+    return _status_snapshot()
 
 
-def signal_handler(sig, frame):
-    global should_shutdown, stream_active
-    if should_shutdown:
-        # Second Ctrl+C: exit the server
-        print("\nForce exit.")
-        os._exit(0)
-    print("\nStopping stream (Ctrl+C again to exit server)...")
-    should_shutdown = True
-    stream_active = False
+@app.get("/stream_status_sse")
+async def stream_status_sse():
+    """Push status to the browser only when it changes."""
 
+    async def gen():
+        last_version = -1
+        while True:
+            if status_version == last_version:
+                try:
+                    await asyncio.wait_for(status_event.wait(), timeout=15.0)
+                except TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+            last_version = status_version
+            yield f"data: {json.dumps(_status_snapshot())}\n\n"
+
+    return StreamingResponse(gen(), media_type="text/event-stream")
+
+
+@app.get("/video_feed")
+async def video_feed():
+    return StreamingResponse(
+        generate_frames(), media_type="multipart/x-mixed-replace; boundary=frame"
+    )
 
-if __name__ == "__main__":
-    signal.signal(signal.SIGINT, signal_handler)
 
+if __name__ == "__main__":
     print("Starting web server at http://127.0.0.1:5001")
     print("Press Start in the browser to begin the session")
 
-    app.run(host="0.0.0.0", port=5001, debug=False, threaded=True)
+    uvicorn.run(app, host="0.0.0.0", port=5001)
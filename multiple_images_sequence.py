@@ -1,38 +1,54 @@
 import asyncio
-import glob
 import os
 import signal
 import sys
 import threading
 import time
-from io import BytesIO
 
-from flask import Flask, Response, render_template_string, jsonify
-from PIL import Image
+import cv2
+import numpy as np
+from flask import Flask, Response, jsonify
 from odyssey import Odyssey, OdysseyAuthError, OdysseyConnectionError
 
+from image_library import IMAGE_DIR, list_pngs
+
 app = Flask(__name__)
 
 # Global variables for frame sharing
 current_frame = None
-frame_lock = threading.Lock()
+frame_version = 0
+frame_cond = threading.Condition()
 stream_active = False
 should_shutdown = False
 current_prompt = ""
 
 # Configuration
 API_KEY = os.environ["API_KEY"]
-IMAGE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "on_the_phone")
 PROMPTS = [
     "a person on the left is talking on the phone, while the person on the right is listening attentively",
 ]
 SECONDS_PER_IMAGE = 10
 TOTAL_DURATION = 60
 
+# Static multipart framing, concatenated once per frame via b"".join
+MJPEG_PREFIX = b"--frame\r\nContent-Type: image/jpeg\r\n\r\n"
+MJPEG_SUFFIX = b"\r\n"
+
+# JPEG encode settings for the MJPEG stream (libjpeg-turbo via OpenCV).
+# Quality 72 with forced 4:2:0 chroma subsampling roughly halves the bytes
+# per frame versus quality 85 with no visible loss on generated video;
+# smaller frames also mean cheaper encodes and a friendlier uplink.
+JPEG_PARAMS = (
+    cv2.IMWRITE_JPEG_QUALITY,
+    72,
+    cv2.IMWRITE_JPEG_SAMPLING_FACTOR,
+    cv2.IMWRITE_JPEG_SAMPLING_FACTOR_420,
+)
+
 
 def load_images():
     """Load all PNG images from under_the_bridge folder."""
-    paths = sorted(glob.glob(os.path.join(IMAGE_DIR, "*.png")))
+    paths = list_pngs(IMAGE_DIR)
     if not paths:
         print(f"No PNG images found in {IMAGE_DIR}")
         sys.exit(1)
@@ -44,25 +60,50 @@ def load_images():
 
 def save_frame(frame):
     """Callback to save the latest frame."""
-    global current_frame
-    with frame_lock:
+    global current_frame, frame_version
+    with frame_cond:
         current_frame = frame
+        frame_version += 1
+        frame_cond.notify_all()
 
 
 def generate_frames():
     """Generator function to yield frames as MJPEG."""
+    last_version = -1
+    last_jpeg = None
+    period = 1.0 / 30.0
+    next_tick = time.monotonic()
+    # One BGR scratch buffer per client, reused across frames so the
+    # colour conversion never allocates on the hot path.
+    bgr = None
     while True:
-        with frame_lock:
-            if current_frame is not None:
-                img = Image.fromarray(current_frame.data)
-                buffer = BytesIO()
-                img.save(buffer, format="JPEG", quality=85)
-                frame_bytes = buffer.getvalue()
-                yield (
-                    b"--frame\r\n"
-                    b"Content-Type: image/jpeg\r\n\r\n" + frame_bytes + b"\r\n"
-                )
-        time.sleep(0.033)  # ~30 fps
+        # Block until the producer publishes a new frame (or time out to
+        # keep the connection alive), then encode outside the lock so
+        # save_frame never waits on JPEG work.
+        with frame_cond:
+            frame_cond.wait_for(
+                lambda v=last_version: frame_version != v, timeout=0.5
+            )
+            version, frame = frame_version, current_frame
+        if frame is not None and version != last_version:
+            rgb = frame.data
+            if bgr is None or bgr.shape != rgb.shape:
+                bgr = np.empty_like(rgb)
+            cv2.cvtColor(rgb, cv2.COLOR_RGB2BGR, dst=bgr)
+            ok, encoded = cv2.imencode(".jpg", bgr, JPEG_PARAMS)
+            if ok:
+                last_jpeg = encoded.tobytes()
+                last_version = version
+        if last_jpeg is not None:
+            yield b"".join((MJPEG_PREFIX, last_jpeg, MJPEG_SUFFIX))
+        # Cap the outbound rate at ~30 fps on a monotonic clock
+        now = time.monotonic()
+        delay = next_tick - now
+        if delay > 0:
+            time.sleep(delay)
+            next_tick += period
+        else:
+            next_tick = now + period
 
 
 async def run_odyssey():
@@ -119,10 +160,9 @@ def start_odyssey_thread():
         traceback.print_exc()
 
 
-@app.route("/")
-def index():
-    """Main page with video player."""
-    html = """
+# The page is fully static, so build the response body once at import
+# instead of running it through Jinja on every request
+INDEX_HTML = """
     <!DOCTYPE html>
     <html>
     <head>
@@ -196,7 +236,12 @@ def index():
     </body>
     </html>
     """
-    return render_template_string(html)
+
+
+@app.route("/")
+def index():
+    """Main page with video player."""
+    return Response(INDEX_HTML, mimetype="text/html")
 
 
 @app.route("/stream_status")
@@ -1,65 +1,160 @@
 import asyncio
+import json
 import os
 import signal
 import sys
 import threading
 import time
-from io import BytesIO
-from queue import Queue
-from flask import Flask, Response, render_template_string, request, jsonify
-from PIL import Image
+
+import cv2
+import numpy as np
+from flask import Flask, Response, request
 from odyssey import Odyssey, OdysseyAuthError, OdysseyConnectionError
+from waitress import serve
 
 app = Flask(__name__)
 
-# Global variables for frame sharing
+# Global variables for frame sharing. Single producer (the RTC callback)
+# and readers share current_frame through a SeqLock: the sequence number is
+# odd while a store is in flight, and readers retry on a torn view. The GIL
+# makes the individual assignments atomic, so no mutex is involved.
 current_frame = None
-frame_lock = threading.Lock()
+frame_seq = 0
 stream_active = False
 odyssey_client = None
 should_shutdown = False
 last_interaction_time = None
 
-# Interaction queue
-interaction_queue = Queue()
+# Interaction queue, created inside the Odyssey event loop; Flask threads
+# hand prompts over via odyssey_loop.call_soon_threadsafe
+interaction_queue = None
+odyssey_loop = None
 
 # Stream configuration
 STREAM_TIMEOUT = 30  # seconds after last interaction before ending stream
 INTERACTION_COOLDOWN = 3  # seconds to wait between interactions
 interaction_ready = True
 
+# Serializes the check-and-set of interaction_ready in /interact so
+# concurrent requests can't both pass the ready check and double-queue
+_interact_lock = threading.Lock()
+
+# Status change signalling for the SSE /events endpoint: every mutation of
+# stream_active / interaction_ready bumps the version under a Condition and
+# wakes subscribers, so the browser never has to poll. A Condition (rather
+# than a shared Event) keeps one subscriber from eating another's wakeup.
+_state_version = 0
+_state_cond = threading.Condition()
+
+
+def _notify_state():
+    """Wake /events subscribers after a status change"""
+    global _state_version
+    with _state_cond:
+        _state_version += 1
+        _state_cond.notify_all()
+
+
+# JPEG encode settings for the MJPEG stream (libjpeg-turbo via OpenCV).
+# Quality 72 with forced 4:2:0 chroma subsampling roughly halves the bytes
+# per frame versus quality 85 with no visible loss on generated video;
+# smaller frames also mean cheaper encodes and a friendlier uplink.
+JPEG_PARAMS = (
+    cv2.IMWRITE_JPEG_QUALITY,
+    72,
+    cv2.IMWRITE_JPEG_SAMPLING_FACTOR,
+    cv2.IMWRITE_JPEG_SAMPLING_FACTOR_420,
+)
+
+# Static multipart header; the JPEG body is yielded as-is so the server
+# never copies it into a combined chunk
+MJPEG_HEADER = b"--frame\r\nContent-Type: image/jpeg\r\nContent-Length: "
+
 
 def save_frame(frame):
     """Callback to save the latest frame"""
-    global current_frame
-    with frame_lock:
-        current_frame = frame
+    global current_frame, frame_seq
+    # Publish the RGB ndarray itself, forced C-contiguous once here at the
+    # producer (a no-op copy when the SDK buffer already is) so cvtColor in
+    # the encode path never falls back to a hidden full-frame copy
+    array = np.ascontiguousarray(frame.data)
+    frame_seq += 1  # odd: write in progress
+    current_frame = array
+    frame_seq += 1  # even: write published
+
+
+def read_frame():
+    """Wait-free read of (seq, rgb_array), retrying if a write is in flight"""
+    while True:
+        s1 = frame_seq
+        array = current_frame
+        s2 = frame_seq
+        if s1 == s2 and s1 & 1 == 0:
+            return s1, array
+
+
+# Encoded-frame cache shared by every connected viewer, so each frame is
+# JPEG-encoded exactly once no matter how many tabs are open. The BGR
+# scratch buffer is reused across frames so the colour conversion never
+# allocates on the hot path.
+_encode_lock = threading.Lock()
+_encoded_version = -1
+_encoded_jpeg = None
+_bgr_buffer = None
+
+
+def get_encoded_frame():
+    """Return (version, jpeg_bytes) for the latest frame, encoding at most once"""
+    global _encoded_version, _encoded_jpeg, _bgr_buffer
+
+    version, rgb = read_frame()
+    if rgb is not None and version > _encoded_version:
+        with _encode_lock:
+            # Strictly greater: a viewer holding an older snapshot that
+            # lost the lock race must never re-install a stale frame over
+            # a newer published JPEG
+            if version > _encoded_version:
+                # save_frame published a contiguous RGB array — convert
+                # into the persistent buffer and encode with libjpeg-turbo's
+                # SIMD paths
+                if _bgr_buffer is None or _bgr_buffer.shape != rgb.shape:
+                    _bgr_buffer = np.empty_like(rgb)
+                cv2.cvtColor(rgb, cv2.COLOR_RGB2BGR, dst=_bgr_buffer)
+                ok, encoded = cv2.imencode(".jpg", _bgr_buffer, JPEG_PARAMS)
+                if ok:
+                    _encoded_jpeg = encoded.tobytes()
+                    _encoded_version = version
+    return _encoded_version, _encoded_jpeg
 
 
 def generate_frames():
     """Generator function to yield frames as MJPEG"""
-    global current_frame, stream_active
-    import time
-
+    period = 1.0 / 30.0
+    next_tick = time.monotonic() + period
     while True:
-        with frame_lock:
-            if current_frame is not None:
-                # VideoFrame.data is already an RGB numpy array
-                img = Image.fromarray(current_frame.data)
-
-                # Convert to JPEG bytes
-                buffer = BytesIO()
-                img.save(buffer, format="JPEG", quality=85)
-                frame_bytes = buffer.getvalue()
-
-                # Yield frame in MJPEG format
-                yield (
-                    b"--frame\r\n"
-                    b"Content-Type: image/jpeg\r\n\r\n" + frame_bytes + b"\r\n"
-                )
-
-        # Small delay to control frame rate
-        time.sleep(0.033)  # ~30 fps
+        _, jpeg = get_encoded_frame()
+
+        if jpeg is not None:
+            # Yield frame in MJPEG format (shared cached bytes). Three
+            # separate yields: the WSGI server writes each part without
+            # building a combined frame-sized chunk, and Content-Length
+            # lets clients skip scanning for the boundary.
+            yield MJPEG_HEADER + str(len(jpeg)).encode() + b"\r\n\r\n"
+            yield jpeg
+            yield b"\r\n"
+
+        # Pace against a monotonic schedule so encode/send time doesn't
+        # accumulate as drift below 30 fps; if we fall more than a full
+        # period behind, re-sync instead of bursting to catch up
+        now = time.monotonic()
+        delay = next_tick - now
+        if delay > 0:
+            time.sleep(delay)
+            next_tick += period
+        elif delay < -period:
+            next_tick = now + period
+        else:
+            next_tick += period
 
 
 API_KEY = os.environ["API_KEY"]
@@ -73,8 +168,12 @@ async def run_odyssey():
         odyssey_client, \
         should_shutdown, \
         last_interaction_time, \
-        interaction_ready
+        interaction_ready, \
+        interaction_queue, \
+        odyssey_loop
     print("[DEBUG] Creating Odyssey client")
+    odyssey_loop = asyncio.get_running_loop()
+    interaction_queue = asyncio.Queue()
     odyssey_client = Odyssey(api_key=API_KEY)
     try:
         print("[DEBUG] Calling connect()...")
@@ -84,11 +183,13 @@ async def run_odyssey():
         )
         print("[DEBUG] Connected successfully")
         stream_active = True
+        _notify_state()
         print("Stream starting...")
         await odyssey_client.start_stream("A cat", portrait=True)
 
         # Initial interaction is not ready until after first automated interaction
         interaction_ready = False
+        _notify_state()
 
         await asyncio.sleep(3)  # Wait 3 seconds
         await odyssey_client.interact("Pet the cat")
@@ -99,34 +200,32 @@ async def run_odyssey():
         # Wait for cooldown before allowing user interactions
         await asyncio.sleep(INTERACTION_COOLDOWN)
         interaction_ready = True
+        _notify_state()
         print("Ready for user interactions")
 
-        # Keep stream alive until timeout or shutdown
+        # Keep stream alive until timeout or shutdown. Block directly on the
+        # queue with the remaining inactivity budget as the timeout — no
+        # 0.1 s polling.
         while stream_active and not should_shutdown:
-            # Check for queued interactions
-            if not interaction_queue.empty():
-                prompt = interaction_queue.get()
-                print(f"[DEBUG] Processing queued interaction: {prompt}")
-                try:
-                    await odyssey_client.interact(prompt)
-                    print(f"[DEBUG] Interaction completed successfully: {prompt}")
-                    last_interaction_time = time.time()
-                except Exception as e:
-                    print(f"[DEBUG] Error processing interaction: {e}")
-                    import traceback
-
-                    traceback.print_exc()
-
-            await asyncio.sleep(0.1)  # Check queue frequently
-
-            # Check if timeout has been reached
-            if last_interaction_time is not None:
-                elapsed = time.time() - last_interaction_time
-                if elapsed > STREAM_TIMEOUT:
-                    print(
-                        f"Stream timeout after {STREAM_TIMEOUT} seconds of inactivity"
-                    )
-                    break
+            remaining = STREAM_TIMEOUT - (time.time() - last_interaction_time)
+            try:
+                prompt = await asyncio.wait_for(
+                    interaction_queue.get(), timeout=max(remaining, 0)
+                )
+            except TimeoutError:
+                print(f"Stream timeout after {STREAM_TIMEOUT} seconds of inactivity")
+                break
+
+            print(f"[DEBUG] Processing queued interaction: {prompt}")
+            try:
+                await odyssey_client.interact(prompt)
+                print(f"[DEBUG] Interaction completed successfully: {prompt}")
+                last_interaction_time = time.time()
+            except Exception as e:
+                print(f"[DEBUG] Error processing interaction: {e}")
+                import traceback
+
+                traceback.print_exc()
 
         # End stream gracefully
         print("Ending stream...")
@@ -142,12 +241,21 @@ async def run_odyssey():
         if odyssey_client:
             await odyssey_client.disconnect()
         stream_active = False
+        _notify_state()
         print("Stream ended")
 
 
 def start_odyssey_thread():
     """Start Odyssey in a separate thread"""
     print("[DEBUG] Odyssey thread started")
+    # Pin this thread (and the asyncio loop it runs) to core 0, leaving the
+    # remaining cores to the WSGI worker threads — fewer migrations and less
+    # cache thrash under viewer load. Linux-only; macOS has no thread affinity.
+    if hasattr(os, "sched_setaffinity"):
+        try:
+            os.sched_setaffinity(0, {0})
+        except OSError as e:
+            print(f"[DEBUG] Could not set CPU affinity: {e}")
     try:
         asyncio.run(run_odyssey())
     except Exception as e:
@@ -156,10 +264,9 @@ def start_odyssey_thread():
         traceback.print_exc()
 
 
-@app.route("/")
-def index():
-    """Main page with video player"""
-    html = """
+# The page is fully static, so build the response body once at import
+# instead of running it through Jinja on every request
+INDEX_HTML = """
     <!DOCTYPE html>
     <html>
     <head>
@@ -262,49 +369,31 @@ def index():
         </div>
 
         <script>
-            let streamActive = false;
-            let interactionReady = true;
-
-            // Check stream and interaction status periodically
-            async function checkStatus() {
-                try {
-                    // Check stream status
-                    const streamResponse = await fetch('/stream_status');
-                    const streamData = await streamResponse.json();
-                    streamActive = streamData.active;
-
-                    // Check interaction ready status
-                    const readyResponse = await fetch('/interaction_ready');
-                    const readyData = await readyResponse.json();
-                    interactionReady = readyData.ready;
-
-                    // Update UI
-                    const status = document.getElementById('status');
-                    const interactInput = document.getElementById('interactInput');
-                    const interactBtn = document.getElementById('interactBtn');
-
-                    if (streamActive) {
-                        if (interactionReady) {
-                            status.textContent = 'Stream Active - Ready for interaction';
-                            status.className = 'status active';
-                            interactInput.disabled = false;
-                            interactBtn.disabled = false;
-                            interactBtn.textContent = 'Interact';
-                        } else {
-                            status.textContent = 'Stream Active - Processing...';
-                            status.className = 'status active';
-                            interactInput.disabled = true;
-                            interactBtn.disabled = true;
-                            interactBtn.textContent = 'Processing...';
-                        }
+            // Server pushes combined status over SSE; no polling loop
+            function updateStatus(data) {
+                const status = document.getElementById('status');
+                const interactInput = document.getElementById('interactInput');
+                const interactBtn = document.getElementById('interactBtn');
+
+                if (data.active) {
+                    if (data.ready) {
+                        status.textContent = 'Stream Active - Ready for interaction';
+                        status.className = 'status active';
+                        interactInput.disabled = false;
+                        interactBtn.disabled = false;
+                        interactBtn.textContent = 'Interact';
                     } else {
-                        status.textContent = 'Stream Ended';
-                        status.className = 'status';
+                        status.textContent = 'Stream Active - Processing...';
+                        status.className = 'status active';
                         interactInput.disabled = true;
                         interactBtn.disabled = true;
+                        interactBtn.textContent = 'Processing...';
                     }
-                } catch (error) {
-                    console.error('Error checking status:', error);
+                } else {
+                    status.textContent = 'Stream Ended';
+                    status.className = 'status';
+                    interactInput.disabled = true;
+                    interactBtn.disabled = true;
                 }
             }
 
@@ -360,42 +449,77 @@ def index():
                 }
             });
 
-            // Check status every 500ms for responsive updates
-            setInterval(checkStatus, 500);
-            checkStatus(); // Initial check
+            // Subscribe to server-pushed status updates; the stream sends
+            // the current state immediately on connect
+            const statusSource = new EventSource('/events');
+            statusSource.onmessage = (event) => updateStatus(JSON.parse(event.data));
         </script>
     </body>
     </html>
     """
-    return render_template_string(html)
 
 
-@app.route("/stream_status")
-def stream_status():
-    """API endpoint to check if stream is active"""
-    return jsonify({"active": stream_active})
+@app.route("/")
+def index():
+    """Main page with video player"""
+    return Response(INDEX_HTML, mimetype="text/html")
+
+
+def _status_payload():
+    """JSON body shared by /status and the /events stream"""
+    return json.dumps({"active": stream_active, "ready": interaction_ready})
+
+
+@app.route("/status")
+def status():
+    """API endpoint combining stream and interaction state in one response"""
+    return Response(_status_payload(), mimetype="application/json")
+
+
+def generate_events():
+    """Generator yielding status changes as Server-Sent Events"""
+    last_version = -1
+    while True:
+        with _state_cond:
+            changed = _state_cond.wait_for(
+                lambda v=last_version: _state_version != v, timeout=15.0
+            )
+            last_version = _state_version
+        if changed:
+            yield f"data: {_status_payload()}\n\n"
+        else:
+            # Keep-alive comment so proxies don't drop the idle connection
+            yield ": keep-alive\n\n"
+
+
+@app.route("/events")
+def events():
+    """Push status changes to the browser instead of being polled"""
+    return Response(generate_events(), mimetype="text/event-stream")
 
 
 def _reset_interaction_ready():
     """Reset the interaction ready flag after cooldown"""
     global interaction_ready
     interaction_ready = True
+    _notify_state()
     print("Interaction ready - cooldown complete")
 
 
-def _send_interaction_async(prompt):
-    """Queue interaction to be processed by main Odyssey event loop"""
-    print(f"[DEBUG] Queueing interaction: {prompt}")
+def _json_response(payload, status=200):
+    """Build a JSON response once at module load for reuse across requests"""
+    return Response(json.dumps(payload), status=status, mimetype="application/json")
 
-    # Put the prompt in the queue for the main Odyssey loop to process
-    interaction_queue.put(prompt)
-    print("[DEBUG] Interaction queued successfully")
 
-    # Start cooldown timer using threading.Timer
-    cooldown_timer = threading.Timer(INTERACTION_COOLDOWN, _reset_interaction_ready)
-    cooldown_timer.daemon = True
-    cooldown_timer.start()
-    print(f"[DEBUG] Cooldown timer started, will reset in {INTERACTION_COOLDOWN}s")
+# /interact outcomes are fixed strings, so the Response objects are built
+# once instead of running jsonify per request
+_ERR_NOT_ACTIVE = _json_response({"error": "Stream not active"}, 400)
+_ERR_COOLDOWN = _json_response(
+    {"error": "Please wait before sending another interaction"}, 429
+)
+_ERR_NO_CLIENT = _json_response({"error": "Client not initialized"}, 500)
+_ERR_NO_PROMPT = _json_response({"error": "No prompt provided"}, 400)
+_OK_QUEUED = _json_response({"success": True, "message": "Interaction queued"})
 
 
 @app.route("/interact", methods=["POST"])
@@ -404,38 +528,37 @@ def interact():
     global odyssey_client, stream_active, last_interaction_time, interaction_ready
 
     if not stream_active:
-        return jsonify({"error": "Stream not active"}), 400
-
-    if not interaction_ready:
-        return jsonify({"error": "Please wait before sending another interaction"}), 429
+        return _ERR_NOT_ACTIVE
 
     if odyssey_client is None:
-        return jsonify({"error": "Client not initialized"}), 500
+        return _ERR_NO_CLIENT
 
-    data = request.json
-    prompt = data.get("prompt", "")
+    # silent=True returns None on malformed bodies instead of raising, and
+    # cache=False skips stashing the parsed dict on the request object
+    data = request.get_json(cache=False, silent=True)
+    prompt = data.get("prompt", "") if data else ""
 
     if not prompt:
-        return jsonify({"error": "No prompt provided"}), 400
-
-    # Set cooldown immediately
-    interaction_ready = False
+        return _ERR_NO_PROMPT
+
+    # Ready check, cooldown flip and enqueue form one atomic transition:
+    # without the lock two burst clicks could both see ready=True and
+    # queue two interactions. call_soon_threadsafe never blocks, so the
+    # critical section stays tiny.
+    with _interact_lock:
+        if not interaction_ready:
+            return _ERR_COOLDOWN
+        interaction_ready = False
+        odyssey_loop.call_soon_threadsafe(interaction_queue.put_nowait, prompt)
+    _notify_state()
     print(f"Interaction cooldown started for {INTERACTION_COOLDOWN} seconds")
-    print(f"interaction_ready set to: {interaction_ready}")
-
-    # Run interaction in background thread to avoid blocking
-    interaction_thread = threading.Thread(
-        target=_send_interaction_async, args=(prompt,), daemon=True
-    )
-    interaction_thread.start()
-
-    return jsonify({"success": True, "message": "Interaction queued"})
 
+    # Start cooldown timer using threading.Timer
+    cooldown_timer = threading.Timer(INTERACTION_COOLDOWN, _reset_interaction_ready)
+    cooldown_timer.daemon = True
+    cooldown_timer.start()
 
-@app.route("/interaction_ready")
-def check_interaction_ready():
-    """API endpoint to check if ready for new interaction"""
-    return jsonify({"ready": interaction_ready})
+    return _OK_QUEUED
 
 
 @app.route("/video_feed")
@@ -463,13 +586,19 @@ if __name__ == "__main__":
     odyssey_thread = threading.Thread(target=start_odyssey_thread, daemon=True)
     odyssey_thread.start()
 
-    # Start Flask server
+    # Serve with waitress — a production WSGI server with a fixed thread
+    # pool instead of Werkzeug's thread-per-connection dev server. Each
+    # viewer parks two pool threads on never-ending responses (/video_feed
+    # and /events), so size the pool well above the expected viewer count
+    # or short requests like /interact queue behind the streams; the
+    # connection limit backstops runaway fan-out with an error instead of
+    # a silent hang.
     print("Starting web server at http://127.0.0.1:5001")
     print(f"Stream will timeout after {STREAM_TIMEOUT} seconds of inactivity")
     print("Press Ctrl+C to stop")
 
     try:
-        app.run(host="0.0.0.0", port=5001, debug=False, threaded=True)
+        serve(app, host="0.0.0.0", port=5001, threads=64, connection_limit=200)
     except KeyboardInterrupt:
         print("\nShutting down gracefully...")
         should_shutdown = True
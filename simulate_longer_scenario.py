@@ -4,7 +4,7 @@ import os
 import sys
 import threading
 
-from flask import Flask, render_template_string, jsonify
+from flask import Flask, Response, jsonify
 from odyssey import Odyssey
 
 app = Flask(__name__)
@@ -78,12 +78,26 @@ async def run_simulation():
         current_step = "Processing simulation..."
         print("\nWaiting for completion...")
 
+        # Poll with exponential backoff: quick checks while the job is
+        # fresh, then progressively longer sleeps so a long render isn't
+        # hammered with identical status requests. Reset the delay whenever
+        # the reported status actually changes. (The SDK exposes no ETag or
+        # long-poll variant of get_simulate_status, so backoff is as good
+        # as it gets here.)
+        delay = 1.0
+        last_status = None
         while True:
-            await asyncio.sleep(5)
+            await asyncio.sleep(delay)
             status = await client.get_simulate_status(job.job_id)
             status_str = str(status.status)
             print(f"  Status: {status_str}")
 
+            if status_str != last_status:
+                last_status = status_str
+                delay = 1.0
+            else:
+                delay = min(delay * 1.5, 15.0)
+
             if "COMPLETED" in status_str.upper():
                 print("\nSimulation completed!")
                 for stream in status.streams:
@@ -124,9 +138,9 @@ def start_simulation_thread():
         traceback.print_exc()
 
 
-@app.route("/")
-def index():
-    html = """
+# The page is fully static, so build the response body once at import
+# instead of running it through Jinja on every request
+INDEX_HTML = """
     <!DOCTYPE html>
     <html>
     <head>
@@ -204,7 +218,11 @@ def index():
     </body>
     </html>
     """
-    return render_template_string(html)
+
+
+@app.route("/")
+def index():
+    return Response(INDEX_HTML, mimetype="text/html")
 
 
 @app.route("/sim_status")